@@ -4,11 +4,19 @@
 Prints JSON to stdout.
 """
 
-import json
+import sys
 import time
+from pathlib import Path
 
+import torch
 from sentence_transformers import SentenceTransformer
 
+# Add project root to path to allow importing from src
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.json_compat import dumps  # noqa: E402
+
 
 def main() -> None:
     test_texts = {
@@ -20,19 +28,44 @@ def main() -> None:
     }
 
     model = SentenceTransformer("all-MiniLM-L6-v2")
-    results = {}
-
-    for label, text in test_texts.items():
-        start = time.time()
-        vec = model.encode([text])
-        end = time.time()
-        results[label] = {
-            "text_len": len(text),
-            "embedding_dim": int(vec.shape[1]),
-            "latency_ms": round((end - start) * 1000, 2),
-        }
-
-    print(json.dumps(results, indent=2))
+    labels, texts = zip(*test_texts.items())
+
+    # Warm-up pass so lazy init (tokenizer, kernels, allocator) is excluded
+    # from the timed runs; inference_mode skips autograd bookkeeping.
+    model.encode(["warm-up"], show_progress_bar=False)
+
+    with torch.inference_mode():
+        # One padded batch = one forward pass, which is the realistic
+        # deployment pattern; per-text encodes are re-timed below for
+        # latency reporting.
+        start = time.perf_counter_ns()
+        vecs = model.encode(
+            list(texts),
+            batch_size=len(texts),
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+            show_progress_bar=False,
+        )
+        batched_ms = round((time.perf_counter_ns() - start) / 1e6, 2)
+
+        results = {}
+        for label, text in zip(labels, texts):
+            start = time.perf_counter_ns()
+            model.encode([text], show_progress_bar=False)
+            end = time.perf_counter_ns()
+            results[label] = {
+                "text_len": len(text),
+                "embedding_dim": int(vecs.shape[1]),
+                "latency_ms": round((end - start) / 1e6, 2),
+            }
+
+    results["batched"] = {
+        "num_texts": len(texts),
+        "embedding_dim": int(vecs.shape[1]),
+        "latency_ms": batched_ms,
+    }
+
+    print(dumps(results, indent=2))
 
 
 if __name__ == "__main__":
@@ -2,49 +2,64 @@
 """Benchmark baseline RAG queries and write results JSON.
 
 Reads NUM_QUERIES from environment (default 10).
-Writes JSON summary to stdout.
+Writes JSON summary to stdout. Set JSONL=1 to also emit one JSON line
+per query as it completes (for streaming consumers).
 """
 
-import json
+import math
 import os
 import time
 
 from src.baseline import get_baseline_response
+from src.json_compat import dumps
 
 
 def main() -> None:
     num_queries = int(os.environ.get("NUM_QUERIES", "10"))
-    results = []
+    emit_jsonl = os.environ.get("JSONL") == "1"
+
+    # Stream aggregation: only the latency floats are retained; everything
+    # else is a running counter, so memory stays flat for large NUM_QUERIES.
+    latencies = []
+    answer_len_total = 0
+    contexts_total = 0
 
     for i in range(num_queries):
-        start = time.time()
+        start = time.perf_counter_ns()
         answer, contexts = get_baseline_response()
-        end = time.time()
+        end = time.perf_counter_ns()
+
+        latency_ms = round((end - start) / 1e6, 2)
+        latencies.append(latency_ms)
+        answer_len_total += len(answer)
+        contexts_total += len(contexts)
 
-        results.append(
-            {
-                "query_num": i + 1,
-                "latency_ms": round((end - start) * 1000, 2),
-                "answer_length": len(answer),
-                "contexts_retrieved": len(contexts),
-            }
-        )
+        if emit_jsonl:
+            print(
+                dumps(
+                    {
+                        "query_num": i + 1,
+                        "latency_ms": latency_ms,
+                        "answer_length": len(answer),
+                        "contexts_retrieved": len(contexts),
+                    }
+                )
+            )
 
-    latencies = [r["latency_ms"] for r in results]
-    avg_latency = sum(latencies) / len(latencies) if latencies else 0
+    latencies.sort()
+    count = len(latencies)
 
     summary = {
         "num_queries": num_queries,
-        "avg_latency_ms": round(avg_latency, 2),
-        "min_latency_ms": min(latencies) if latencies else 0,
-        "max_latency_ms": max(latencies) if latencies else 0,
-        "p95_latency_ms": (
-            sorted(latencies)[int(len(latencies) * 0.95)] if latencies else 0
-        ),
-        "queries": results,
+        "avg_latency_ms": round(sum(latencies) / count, 2) if count else 0,
+        "min_latency_ms": latencies[0] if count else 0,
+        "max_latency_ms": latencies[-1] if count else 0,
+        "p95_latency_ms": latencies[math.ceil(count * 0.95) - 1] if count else 0,
+        "avg_answer_length": round(answer_len_total / count, 1) if count else 0,
+        "avg_contexts_retrieved": round(contexts_total / count, 1) if count else 0,
     }
 
-    print(json.dumps(summary, indent=2))
+    print(dumps(summary, indent=2))
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ Note: The clean/ and poison/ directories are now empty by default.
 All document data should be managed through documents.json directly.
 """
 
-import json
+import os
 import sys
 from pathlib import Path
 
@@ -27,6 +27,7 @@ from src.config import (  # noqa: E402
     DOCUMENTS_JSON,
     POISON_DIR,
 )
+from src.json_compat import dumps_bytes  # noqa: E402
 
 
 def _source_name_from_stem(stem: str) -> str:
@@ -36,33 +37,65 @@ def _source_name_from_stem(stem: str) -> str:
     return "press_release"
 
 
+def _list_txt_files(directory: Path) -> list[str]:
+    """Sorted .txt file names via os.scandir (cheaper than Path.glob)."""
+    if not directory.is_dir():
+        return []
+    with os.scandir(directory) as it:
+        return sorted(
+            e.name
+            for e in it
+            if e.is_file(follow_symlinks=False) and e.name.endswith(".txt")
+        )
+
+
+def _read_text(directory: Path, name: str) -> str:
+    with open(os.path.join(directory, name), "rb") as f:
+        # Strip while still bytes so only the trimmed content is decoded.
+        return f.read().strip().decode("utf-8")
+
+
 def build_from_dirs() -> dict:
     """Build { clean: [...], poison: [...] } from CLEAN_DIR and POISON_DIR."""
     clean = []
-    for f in sorted(CLEAN_DIR.glob("*.txt")):
+    for name in _list_txt_files(CLEAN_DIR):
+        stem = name[: -len(".txt")]
         clean.append(
             {
-                "id": f.stem,
-                "source": f.name,
+                "id": stem,
+                "source": name,
                 "source_name": "official",
-                "content": f.read_text(encoding="utf-8").strip(),
+                "content": _read_text(CLEAN_DIR, name),
             }
         )
 
     poison = []
-    for f in sorted(POISON_DIR.glob("*.txt")):
+    for name in _list_txt_files(POISON_DIR):
+        stem = name[: -len(".txt")]
         poison.append(
             {
-                "id": f.stem,
-                "source": f.name,
-                "source_name": _source_name_from_stem(f.stem),
-                "content": f.read_text(encoding="utf-8").strip(),
+                "id": stem,
+                "source": name,
+                "source_name": _source_name_from_stem(stem),
+                "content": _read_text(POISON_DIR, name),
             }
         )
 
     return {"clean": clean, "poison": poison}
 
 
+def _sources_unchanged() -> bool:
+    """True when documents.json is newer than every source .txt file."""
+    if not DOCUMENTS_JSON.exists():
+        return False
+    output_mtime = DOCUMENTS_JSON.stat().st_mtime
+    for directory in (CLEAN_DIR, POISON_DIR):
+        for name in _list_txt_files(directory):
+            if os.stat(os.path.join(directory, name)).st_mtime > output_mtime:
+                return False
+    return True
+
+
 def main():
     print("=" * 70)
     print("WARNING: This is a LEGACY script.")
@@ -71,6 +104,10 @@ def main():
     print("=" * 70)
     print()
 
+    if _sources_unchanged():
+        print(f"{DOCUMENTS_JSON} is newer than all source .txt files; nothing to do.")
+        return
+
     DOCUMENTS_DIR.mkdir(parents=True, exist_ok=True)
     data = build_from_dirs()
 
@@ -80,9 +117,9 @@ def main():
         print("If you need to add documents, edit documents.json directly.")
         return
 
-    DOCUMENTS_JSON.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    # Write UTF-8 bytes directly; no intermediate text-mode encoding pass.
+    with open(DOCUMENTS_JSON, "wb") as f:
+        f.write(dumps_bytes(data, indent=2))
     print(
         f"Wrote {len(data['clean'])} clean + {len(data['poison'])} poison entries to {DOCUMENTS_JSON}"
     )
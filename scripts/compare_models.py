@@ -1,11 +1,12 @@
 """Compare BIRS results across multiple Ollama models."""
 
-import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from src.json_compat import dumps
 from src.run_suite import run_suite
 
 
@@ -19,7 +20,10 @@ def compare_models(models, output_dir="results/model_comparison"):
     Returns:
         dict: Comparison results for all models
     """
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    # Filesystem-safe name per model, computed once instead of at each use.
+    safe = {m: m.replace(":", "_") for m in models}
     results = {}
 
     print("\n" + "=" * 60)
@@ -38,9 +42,9 @@ def compare_models(models, output_dir="results/model_comparison"):
             suite_results = run_suite()
 
             # Save individual model results
-            model_file = Path(output_dir) / f"{model.replace(':', '_')}_results.json"
-            with open(model_file, "w") as f:
-                json.dump(suite_results, f, indent=2)
+            model_file = out / f"{safe[model]}_results.json"
+            with open(model_file, "w", encoding="utf-8") as f:
+                f.write(dumps(suite_results, indent=2))
 
             results[model] = suite_results
             print(f"✓ {model} complete")
@@ -50,15 +54,15 @@ def compare_models(models, output_dir="results/model_comparison"):
             results[model] = {"error": str(e)}
 
     # Save comparison summary
-    comparison_file = Path(output_dir) / "comparison.json"
+    comparison_file = out / "comparison.json"
     comparison_data = {
         "timestamp": datetime.now().isoformat(),
         "models_tested": len(models),
         "results": results,
     }
 
-    with open(comparison_file, "w") as f:
-        json.dump(comparison_data, f, indent=2)
+    with open(comparison_file, "w", encoding="utf-8") as f:
+        f.write(dumps(comparison_data, indent=2))
 
     # Print summary table
     print("\n" + "=" * 60)
@@ -84,7 +88,7 @@ def compare_models(models, output_dir="results/model_comparison"):
     print(f"📊 Summary: {comparison_file}")
 
     # Generate comparison visualization
-    _generate_comparison_html(results, output_dir)
+    _generate_comparison_html(results, out, safe)
 
     return results
 
@@ -95,37 +99,38 @@ def ensure_models_available(models):
     print("CHECKING MODEL AVAILABILITY")
     print("=" * 60 + "\n")
 
-    for model in models:
+    def pull(model):
         print(f"Ensuring {model} is available...")
-        result = subprocess.run(
-            ["ollama", "pull", model], capture_output=True, text=True
-        )
+        return subprocess.run(["ollama", "pull", model], capture_output=True, text=True)
 
-        if result.returncode == 0:
-            print(f"✓ {model} ready")
-        else:
-            print(f"⚠ {model} pull failed (may already be available)")
+    # Pulls are network-bound downloads the Ollama daemon handles
+    # concurrently, so overlap them instead of waiting on each in turn.
+    with ThreadPoolExecutor(max_workers=min(4, len(models))) as ex:
+        for model, result in zip(models, ex.map(pull, models)):
+            if result.returncode == 0:
+                print(f"✓ {model} ready")
+            else:
+                print(f"⚠ {model} pull failed (may already be available)")
 
 
-def _generate_comparison_html(results: dict, output_dir: str):
+def _generate_comparison_html(results: dict, out: Path, safe: dict):
     """Generate interactive HTML comparison of multiple models."""
     try:
         from src.visualize import generate_html_report
 
         print("\n📊 Generating comparison visualizations...")
 
-        # Generate individual reports
-        output_path = Path(output_dir)
-        for model in results.keys():
-            if "error" not in results[model]:
-                model_file = output_path / f"{model.replace(':', '_')}_results.json"
-                if model_file.exists():
-                    html_path = generate_html_report(model_file)
-                    print(f"  ✓ {model}: {html_path.name}")
+        # Generate individual reports from the in-memory results; the JSON
+        # files were just written and don't need to be read back.
+        for model, data in results.items():
+            if "error" not in data:
+                model_file = out / f"{safe[model]}_results.json"
+                html_path = generate_html_report(model_file, results=data)
+                print(f"  ✓ {model}: {html_path.name}")
 
         # Generate comparison dashboard
-        comparison_html = _build_comparison_dashboard(results, output_dir)
-        comparison_path = output_path / "comparison.html"
+        comparison_html = _build_comparison_dashboard(results, safe)
+        comparison_path = out / "comparison.html"
         with open(comparison_path, "w", encoding="utf-8") as f:
             f.write(comparison_html)
 
@@ -135,7 +140,7 @@ def _generate_comparison_html(results: dict, output_dir: str):
         print(f"⚠️ Could not generate visualizations: {e}")
 
 
-def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
+def _build_comparison_dashboard(results: dict, safe: dict) -> str:
     """Build comparison dashboard HTML."""
     from datetime import datetime
 
@@ -148,24 +153,39 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
         scoring = data.get("scoring", {})
         tests = data.get("tests", {})
 
+        # One pass over the per-test dicts gathers score sum and pass count.
+        score_sum = 0.0
+        tests_passed = 0
+        for t in tests.values():
+            score_sum += t.get("score", 0)
+            if t.get("pass", False):
+                tests_passed += 1
+
         model_metrics[model] = {
             "sentiment_drift": abs(scoring.get("sentiment_drift", 0)),
             "citation_fidelity": scoring.get("citation_fidelity", 0),
             "liar_score": scoring.get("liar_score", 0),
-            "avg_score": (
-                sum(t.get("score", 0) for t in tests.values()) / len(tests)
-                if tests
-                else 0
-            ),
-            "pass_rate": (
-                sum(1 for t in tests.values() if t.get("pass", False)) / len(tests)
-                if tests
-                else 0
-            ),
-            "tests_passed": sum(1 for t in tests.values() if t.get("pass", False)),
+            "avg_score": score_sum / len(tests) if tests else 0,
+            "pass_rate": tests_passed / len(tests) if tests else 0,
+            "tests_passed": tests_passed,
             "tests_total": len(tests),
         }
 
+    # Serialize each chart series once; the model-name list alone appears in
+    # four places below.
+    metrics = list(model_metrics.values())
+    model_names_json = dumps(list(model_metrics.keys()))
+    pass_rates_json = dumps([m["pass_rate"] * 100 for m in metrics])
+    pass_colors_json = dumps([m["pass_rate"] for m in metrics])
+    pass_labels_json = dumps(
+        [f"{m['tests_passed']}/{m['tests_total']}" for m in metrics]
+    )
+    avg_scores_json = dumps([m["avg_score"] for m in metrics])
+    avg_labels_json = dumps([f"{m['avg_score']:.2f}" for m in metrics])
+    sentiment_stability_json = dumps([1 - m["sentiment_drift"] for m in metrics])
+    citation_fidelity_json = dumps([m["citation_fidelity"] for m in metrics])
+    lie_resistance_json = dumps([1 - m["liar_score"] for m in metrics])
+
     # Build HTML
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -294,7 +314,7 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
             <div class="chart-section">
                 <h2>📄 Individual Model Reports</h2>
                 <div class="model-links">
-                    {_generate_model_links(results)}
+                    {_generate_model_links(results, safe)}
                 </div>
             </div>
         </div>
@@ -303,16 +323,16 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
     <script>
         // Pass Rate Chart
         const passRateData = [{{
-            x: {json.dumps(list(model_metrics.keys()))},
-            y: {json.dumps([m['pass_rate'] * 100 for m in model_metrics.values()])},
+            x: {model_names_json},
+            y: {pass_rates_json},
             type: 'bar',
             marker: {{
-                color: {json.dumps([m['pass_rate'] for m in model_metrics.values()])},
+                color: {pass_colors_json},
                 colorscale: [[0, '#ef4444'], [0.5, '#fbbf24'], [1, '#10b981']],
                 cmin: 0,
                 cmax: 1
             }},
-            text: {json.dumps([f"{m['tests_passed']}/{m['tests_total']}" for m in model_metrics.values()])},
+            text: {pass_labels_json},
             textposition: 'auto',
         }}];
 
@@ -331,11 +351,11 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
 
         // Average Score Chart
         const avgScoreData = [{{
-            x: {json.dumps(list(model_metrics.keys()))},
-            y: {json.dumps([m['avg_score'] for m in model_metrics.values()])},
+            x: {model_names_json},
+            y: {avg_scores_json},
             type: 'bar',
             marker: {{ color: '#667eea' }},
-            text: {json.dumps([f"{m['avg_score']:.2f}" for m in model_metrics.values()])},
+            text: {avg_labels_json},
             textposition: 'auto',
         }}];
 
@@ -356,22 +376,22 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
         const robustnessData = [
             {{
                 name: 'Sentiment Stability',
-                x: {json.dumps(list(model_metrics.keys()))},
-                y: {json.dumps([1 - m['sentiment_drift'] for m in model_metrics.values()])},
+                x: {model_names_json},
+                y: {sentiment_stability_json},
                 type: 'bar',
                 marker: {{ color: '#10b981' }}
             }},
             {{
                 name: 'Citation Fidelity',
-                x: {json.dumps(list(model_metrics.keys()))},
-                y: {json.dumps([m['citation_fidelity'] for m in model_metrics.values()])},
+                x: {model_names_json},
+                y: {citation_fidelity_json},
                 type: 'bar',
                 marker: {{ color: '#3b82f6' }}
             }},
             {{
                 name: 'Lie Resistance',
-                x: {json.dumps(list(model_metrics.keys()))},
-                y: {json.dumps([1 - m['liar_score'] for m in model_metrics.values()])},
+                x: {model_names_json},
+                y: {lie_resistance_json},
                 type: 'bar',
                 marker: {{ color: '#f59e0b' }}
             }}
@@ -396,12 +416,12 @@ def _build_comparison_dashboard(results: dict, output_dir: str) -> str:
     return html
 
 
-def _generate_model_links(results: dict) -> str:
+def _generate_model_links(results: dict, safe: dict) -> str:
     """Generate links to individual model reports."""
     links = []
     for model in results.keys():
         if "error" not in results[model]:
-            filename = f"{model.replace(':', '_')}_results.html"
+            filename = f"{safe[model]}_results.html"
             links.append(f'<a href="{filename}" class="model-link">📊 {model}</a>')
     return "\n".join(links)
 
@@ -12,17 +12,14 @@ URL sources (in order of priority):
 
 import argparse
 import json
-import os
 import sys
 from pathlib import Path
 
 # Add project root to path to allow importing from src
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
-os.environ.setdefault("PYTHONPATH", str(PROJECT_ROOT))
 
 from src.config import CLEAN_DIR, DOCUMENTS_JSON  # noqa: E402
-from src.crawler import crawl_brand  # noqa: E402
 
 
 def load_seed_urls_from_file(filepath: Path) -> dict[str, list[str]]:
@@ -99,8 +96,17 @@ Examples:
         action="store_true",
         help="Do not warn when a crawled page is highly negative",
     )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of overlapping fetches (default: 8; 1 = serial)",
+    )
     args = p.parse_args()
 
+    # Deferred: pulls in requests/trafilatura/bs4, which --help never needs.
+    from src.crawler import crawl_brand
+
     # Determine URLs to use
     urls_to_crawl = None
     if args.urls:
@@ -133,6 +139,7 @@ Examples:
         use_search=not args.no_search,
         min_sentiment=args.min_sentiment,
         warn_negative=not args.no_warn_negative,
+        concurrency=args.concurrency,
     )
     if output_json and saved:
         print(
@@ -1,33 +1,59 @@
 #!/usr/bin/env python3
 """Generate coverage badge data from coverage.json"""
 
-import json
-
-with open("coverage.json") as f:
-    data = json.load(f)
-    coverage = data["totals"]["percent_covered"]
-
-# Determine color
-if coverage >= 80:
-    color = "brightgreen"
-elif coverage >= 60:
-    color = "yellow"
-elif coverage >= 40:
-    color = "orange"
-else:
-    color = "red"
+import mmap
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path to allow importing from src
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.json_compat import dumps_bytes, loads  # noqa: E402
+
+_PERCENT_RE = re.compile(rb'"percent_covered"\s*:\s*([0-9.]+)')
+
+
+def read_percent_covered(path: str = "coverage.json") -> float:
+    """Pull totals.percent_covered without parsing the whole report.
+
+    coverage.json carries per-file line data (easily tens of MB); the
+    totals block sits at the end, so a tail scan over a memory-mapped
+    view reads only what the badge needs. Falls back to a full parse if
+    the layout ever changes.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            start = mm.rfind(b'"totals"')
+            if start != -1:
+                m = _PERCENT_RE.search(mm, start)
+                if m:
+                    return float(m.group(1))
+    except ValueError:
+        pass
+    return float(loads(Path(path).read_bytes())["totals"]["percent_covered"])
+
+
+coverage = read_percent_covered()
+
+# Determine color from the first threshold band the coverage clears
+COLOR_BANDS = ((80, "brightgreen"), (60, "yellow"), (40, "orange"), (0, "red"))
+color = next(c for t, c in COLOR_BANDS if coverage >= t)
 
 print(f"Coverage: {coverage:.1f}%")
 print(f"Color: {color}")
 
 # Create simple badge data
-with open("coverage-badge.json", "w") as out:
-    json.dump(
+Path("coverage-badge.json").write_bytes(
+    dumps_bytes(
         {
             "schemaVersion": 1,
             "label": "coverage",
             "message": f"{coverage:.1f}%",
             "color": color,
-        },
-        out,
+        }
     )
+)
@@ -7,26 +7,50 @@ Creates two collections:
 Run from project root: python scripts/ingest_documents.py
 """
 
-import json
+import hashlib
 import os
 import sys
 from pathlib import Path
 
-from chromadb import PersistentClient
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 # Add project root to path to allow importing from src
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
-os.environ.setdefault("PYTHONPATH", str(PROJECT_ROOT))
 
 from src.config import (  # noqa: E402
     CHROMA_DIR,
     COLLECTION_CLEAN,
     COLLECTION_POISONED,
+    DATA_DIR,
     DOCUMENTS_JSON,
     EMBEDDING_MODEL,
 )
+from src.json_compat import loads  # noqa: E402
+
+# Sidecar cache of embeddings keyed by a content digest: unchanged documents
+# skip the encode pass entirely on re-ingest, which is the expensive step.
+# blake2b is the fastest keyed hash in the stdlib and 16 bytes is plenty for
+# a cache key (no adversarial collisions here).
+EMBED_CACHE_FILE = DATA_DIR / ".embed_cache.npz"
+
+
+def _content_digest(content: str) -> str:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_embed_cache() -> dict[str, np.ndarray]:
+    """Load the digest -> embedding cache, or an empty dict if absent."""
+    try:
+        with np.load(EMBED_CACHE_FILE) as npz:
+            return {key: npz[key] for key in npz.files}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_embed_cache(cache: dict[str, np.ndarray]) -> None:
+    EMBED_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(EMBED_CACHE_FILE, **cache)
 
 
 def load_documents() -> dict:
@@ -37,8 +61,7 @@ def load_documents() -> dict:
             "Create it first or use scripts/build_documents_json.py to generate from .txt files."
         )
 
-    with open(DOCUMENTS_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = loads(DOCUMENTS_JSON.read_bytes())
 
     if "clean" not in data or "poison" not in data:
         raise ValueError("documents.json must have 'clean' and 'poison' keys")
@@ -46,20 +69,17 @@ def load_documents() -> dict:
     return data
 
 
-def ingest_collection(client, collection_name: str, documents: list[dict], embedder):
+def ingest_collection(
+    client, collection_name: str, documents: list[dict], embedder, embed_cache
+):
     """
     Ingest documents into a ChromaDB collection.
     Each document should have: id, source, source_name, content
+    Embeddings for already-seen content are reused from embed_cache.
     """
-    # Delete collection if it exists (fresh ingest)
-    try:
-        client.delete_collection(collection_name)
-        print(f"Deleted existing collection: {collection_name}")
-    except Exception:
-        pass
-
-    # Create collection
-    collection = client.create_collection(
+    # Upsert into the existing collection instead of delete + full rebuild,
+    # so unchanged docs keep their rows and only the payload below is written.
+    collection = client.get_or_create_collection(
         name=collection_name,
         metadata={"description": f"BIRS collection: {collection_name}"},
     )
@@ -79,18 +99,50 @@ def ingest_collection(client, collection_name: str, documents: list[dict], embed
         for doc in documents
     ]
 
-    # Generate embeddings
-    print(f"Generating embeddings for {len(documents)} documents...")
-    embeddings = embedder.encode(contents, show_progress_bar=True).tolist()
-
-    # Add to collection
-    collection.add(
-        ids=ids,
-        embeddings=embeddings,
-        documents=contents,
-        metadatas=metadatas,
+    # Generate embeddings only for content not already in the cache.
+    # Misses are encoded longest-first so each padded batch packs
+    # similar-length texts; the permutation is undone when merging back.
+    digests = [_content_digest(c) for c in contents]
+    misses = [i for i, d in enumerate(digests) if d not in embed_cache]
+    print(
+        f"Generating embeddings for {len(misses)} of {len(documents)} documents "
+        f"({len(documents) - len(misses)} cached)..."
+    )
+    if misses:
+        misses.sort(key=lambda i: len(contents[i]), reverse=True)
+        encoded = embedder.encode(
+            [contents[i] for i in misses],
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=True,
+        )
+        encoded = encoded.astype(np.float32, copy=False)
+        for pos, i in enumerate(misses):
+            embed_cache[digests[i]] = encoded[pos]
+    # Hand Chroma one contiguous float32 matrix: a list-of-lists would box
+    # every value as a PyFloat (~10x the memory) just to be converted back.
+    embeddings = np.ascontiguousarray(
+        np.stack([embed_cache[d] for d in digests]), dtype=np.float32
     )
 
+    # Upsert in batches: one giant payload makes the client serialize
+    # everything in memory and commit a single huge sqlite transaction.
+    BATCH = 1000
+    for start in range(0, len(ids), BATCH):
+        sl = slice(start, start + BATCH)
+        collection.upsert(
+            ids=ids[sl],
+            embeddings=embeddings[sl],
+            documents=contents[sl],
+            metadatas=metadatas[sl],
+        )
+
+    # Drop rows whose ids vanished from documents.json since the last run.
+    stale = set(collection.get(include=[])["ids"]) - set(ids)
+    if stale:
+        collection.delete(ids=sorted(stale))
+        print(f"Removed {len(stale)} stale document(s) from {collection_name}")
+
     print(f"✓ Ingested {len(documents)} documents into {collection_name}")
 
 
@@ -109,6 +161,12 @@ def main():
     print(f"Found {len(clean_docs)} clean documents")
     print(f"Found {len(poison_docs)} poison documents")
 
+    # Heavy imports are deferred so `--help` and early failures don't pay
+    # the torch/chromadb import cost (~seconds of extension modules).
+    import torch
+    from chromadb import PersistentClient
+    from sentence_transformers import SentenceTransformer
+
     # Initialize ChromaDB
     CHROMA_DIR.mkdir(parents=True, exist_ok=True)
     client = PersistentClient(path=str(CHROMA_DIR))
@@ -117,15 +175,38 @@ def main():
     print(f"\nLoading embedding model: {EMBEDDING_MODEL}")
     print("(First run will download the model, ~80MB)")
     embedder = SentenceTransformer(EMBEDDING_MODEL)
+    if torch.cuda.is_available():
+        # FP16 on GPU halves memory bandwidth for the encode pass.
+        embedder = embedder.to("cuda").half()
+
+    # Opt-in torch.compile: autotuned kernels amortize across the two
+    # collection passes, but compilation itself costs tens of seconds, so
+    # it only pays off for large corpora (set BIRS_TORCH_COMPILE=1).
+    if os.environ.get("BIRS_TORCH_COMPILE") == "1" and hasattr(torch, "compile"):
+        try:
+            embedder[0].auto_model = torch.compile(
+                embedder[0].auto_model, mode="reduce-overhead", dynamic=True
+            )
+            # Pay the compile cost here, not mid-batch under the progress bar.
+            embedder.encode(["warmup"] * 8, show_progress_bar=False)
+        except Exception as e:
+            print(f"(torch.compile unavailable, continuing eager: {e})")
+
+    embed_cache = load_embed_cache()
+    cached_before = len(embed_cache)
 
     # Ingest clean collection (baseline)
     print(f"\n1. Ingesting CLEAN collection ({COLLECTION_CLEAN})...")
-    ingest_collection(client, COLLECTION_CLEAN, clean_docs, embedder)
+    ingest_collection(client, COLLECTION_CLEAN, clean_docs, embedder, embed_cache)
 
-    # Ingest poisoned collection (clean + poison)
+    # Ingest poisoned collection (clean + poison); the clean docs' embeddings
+    # are already cached from the pass above.
     print(f"\n2. Ingesting POISONED collection ({COLLECTION_POISONED})...")
     combined_docs = clean_docs + poison_docs
-    ingest_collection(client, COLLECTION_POISONED, combined_docs, embedder)
+    ingest_collection(client, COLLECTION_POISONED, combined_docs, embedder, embed_cache)
+
+    if len(embed_cache) > cached_before:
+        save_embed_cache(embed_cache)
 
     print("\n" + "=" * 60)
     print("✓ Ingestion complete!")
@@ -4,7 +4,24 @@
 Reads `extended_results.json` and exits non-zero if minimum scores are not met.
 """
 
-import json
+import sys
+from pathlib import Path
+
+# Add project root to path to allow importing from src
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.json_compat import loads  # noqa: E402
+
+# Optional ijson (skip if not installed): streams just the gated keys out
+# of extended_results.json instead of parsing the whole file, which can be
+# multi-MB once contexts and answers are included.
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 MIN_ACCEPTABLE_SCORES = {
     "birs_01": 0.5,  # Grounding
@@ -16,11 +33,23 @@ MIN_ACCEPTABLE_SCORES = {
 }
 
 
-def main() -> None:
-    with open("extended_results.json", "r", encoding="utf-8") as fp:
-        data = json.load(fp)
+def _load_gated_results(path: str) -> dict:
+    """Read only the gated entries of test_results, streaming when possible."""
+    if IJSON_AVAILABLE:
+        needed = set(MIN_ACCEPTABLE_SCORES)
+        test_results = {}
+        with open(path, "rb") as fp:
+            for test_id, result in ijson.kvitems(fp, "test_results"):
+                if test_id in needed:
+                    test_results[test_id] = result
+                    if len(test_results) == len(needed):
+                        break
+        return test_results
+    return loads(Path(path).read_bytes()).get("test_results", {})
+
 
-    test_results = data.get("test_results", {})
+def main() -> None:
+    test_results = _load_gated_results("extended_results.json")
 
     failures: list[str] = []
     for test_id, min_score in MIN_ACCEPTABLE_SCORES.items():
@@ -38,9 +67,12 @@ def main() -> None:
             )
 
     if failures:
-        print("❌ Regressions detected:")
-        for failure in failures:
-            print(f"- {failure}")
+        # One buffered write for the whole report instead of a flush per line.
+        sys.stdout.write(
+            "❌ Regressions detected:\n"
+            + "\n".join(f"- {failure}" for failure in failures)
+            + "\n"
+        )
         raise SystemExit(1)
 
     print("✅ No regressions detected (all gates passed)")
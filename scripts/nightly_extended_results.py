@@ -4,10 +4,16 @@
 This is used by the nightly GitHub Actions workflow.
 """
 
-import json
+import sys
+from pathlib import Path
 
+from src.json_compat import dumps_bytes, loads
 from src.run_suite import run_suite
 
+# Known test ids, probed directly instead of prefix-scanning every top-level
+# key of the results file.
+TEST_IDS = ("birs_01", "birs_02", "birs_03", "birs_04", "birs_05", "birs_06")
+
 
 def main() -> None:
     results_path = run_suite(
@@ -16,23 +22,24 @@ def main() -> None:
         run_deepeval=False,  # Don't require API key for nightly
     )
 
-    with open(results_path) as f:
-        data = json.load(f)
+    data = loads(Path(results_path).read_bytes())
 
+    # Single pass over the known test ids: O(k) dict probes instead of a
+    # startswith scan over every top-level key, with the pass/score
+    # aggregates folded into the same loop.
     test_results = {}
-    for key, value in data.items():
-        if key.startswith("birs_") and isinstance(value, dict):
-            test_results[key] = {
-                "pass": bool(value.get("pass", False)),
-                "score": value.get("score", 0),
-            }
-
-    passing_tests = sum(1 for t in test_results.values() if t["pass"])
-    avg_score = (
-        sum(t["score"] for t in test_results.values()) / len(test_results)
-        if test_results
-        else 0
-    )
+    passing_tests = 0
+    score_sum = 0.0
+    for test_id in TEST_IDS:
+        value = data.get(test_id)
+        if isinstance(value, dict):
+            passed = bool(value.get("pass", False))
+            score = value.get("score", 0)
+            test_results[test_id] = {"pass": passed, "score": score}
+            passing_tests += passed
+            score_sum += score
+
+    avg_score = score_sum / len(test_results) if test_results else 0
 
     summary = {
         "results_path": results_path,
@@ -45,7 +52,7 @@ def main() -> None:
         "test_results": test_results,
     }
 
-    print(json.dumps(summary, indent=2))
+    sys.stdout.buffer.write(dumps_bytes(summary, indent=2) + b"\n")
 
 
 if __name__ == "__main__":
@@ -4,8 +4,10 @@
 This script is intended for GitHub Actions. It writes JSON results to stdout.
 """
 
-import json
+import sys
+from pathlib import Path
 
+from src.json_compat import dumps_bytes, loads
 from src.run_suite import run_suite
 
 
@@ -17,8 +19,7 @@ def main() -> None:
         run_deepeval=False,
     )
 
-    with open(results_path) as f:
-        data = json.load(f)
+    data = loads(Path(results_path).read_bytes())
 
     summary = {
         "results_path": results_path,
@@ -26,7 +27,7 @@ def main() -> None:
         "status": data.get("status", "unknown"),
     }
 
-    print(json.dumps(summary, indent=2))
+    sys.stdout.buffer.write(dumps_bytes(summary, indent=2) + b"\n")
 
 
 if __name__ == "__main__":
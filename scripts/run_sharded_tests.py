@@ -10,10 +10,11 @@ Usage:
 """
 
 import argparse
+import asyncio
+import os
 import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Fix Unicode support on Windows
@@ -30,11 +31,44 @@ if sys.platform == "win32":
 
 
 def run_shard(
-    shard_id: int, total_shards: int, python_exe: str = "python"
+    shard_id: int,
+    total_shards: int,
+    python_exe: str = "python",
+    store_durations: bool = True,
 ) -> tuple[int, str, float]:
     """Run a single test shard."""
     start_time = time.time()
 
+    cmd = _shard_cmd(shard_id, total_shards, python_exe, store_durations)
+
+    print(f"[>>] Starting shard {shard_id}/{total_shards}...")
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+        duration = time.time() - start_time
+
+        if result.returncode == 0:
+            status = f"[OK] Shard {shard_id}/{total_shards} PASSED ({duration:.2f}s)"
+        else:
+            status = f"[FAIL] Shard {shard_id}/{total_shards} FAILED ({duration:.2f}s)"
+
+        return result.returncode, status, duration
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return 1, f"[ERROR] Shard {shard_id}/{total_shards} ERROR: {e}", duration
+
+
+def _shard_cmd(
+    shard_id: int, total_shards: int, python_exe: str, store_durations: bool
+) -> list[str]:
+    """Build the pytest command for one shard.
+
+    Durations are only stored from a single-writer run (sequential or
+    --calibrate, or BIRS_STORE_DURATIONS=1): parallel shards racing to
+    write .test_durations corrupt the balance data for the next split.
+    """
     cmd = [
         python_exe,
         "-m",
@@ -45,29 +79,88 @@ def run_shard(
         str(total_shards),
         "--group",
         str(shard_id),
-        "--store-durations",
+    ]
+    if store_durations:
+        cmd.append("--store-durations")
+    cmd += [
         "--durations-path=.test_durations",
         "-m",
         "not integration and not e2e",
     ]
+    return cmd
+
+
+class _ShardFailure(Exception):
+    """Raised by a failing shard to cancel its siblings under --fail-fast."""
+
+
+async def _run_shard_streamed(
+    shard_id: int, total_shards: int, python_exe: str, store_durations: bool
+) -> tuple[int, str, float]:
+    """Run one shard, streaming its output line-by-line with a shard prefix.
+
+    Streaming (instead of capture_output) surfaces progress and failures
+    immediately and avoids buffering whole test logs in memory.
+    """
+    start_time = time.time()
+
+    cmd = _shard_cmd(shard_id, total_shards, python_exe, store_durations)
 
     print(f"[>>] Starting shard {shard_id}/{total_shards}...")
 
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            sys.stdout.write(f"[shard {shard_id}] {line.decode(errors='replace')}")
+        returncode = await proc.wait()
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    duration = time.time() - start_time
+    if returncode == 0:
+        status = f"[OK] Shard {shard_id}/{total_shards} PASSED ({duration:.2f}s)"
+    else:
+        status = f"[FAIL] Shard {shard_id}/{total_shards} FAILED ({duration:.2f}s)"
+    return returncode, status, duration
 
-        duration = time.time() - start_time
 
-        if result.returncode == 0:
-            status = f"[OK] Shard {shard_id}/{total_shards} PASSED ({duration:.2f}s)"
-        else:
-            status = f"[FAIL] Shard {shard_id}/{total_shards} FAILED ({duration:.2f}s)"
+async def _gather_shards(args) -> list[tuple[int, str, float]]:
+    """Run all shards concurrently; under --fail-fast cancel on first failure."""
+    results: list[tuple[int, str, float]] = []
 
-        return result.returncode, status, duration
+    async def run_one(shard_id: int) -> None:
+        returncode, status, duration = await _run_shard_streamed(
+            shard_id, args.shards, args.python_version, args.store_durations
+        )
+        print(status)
+        results.append((returncode, status, duration))
+        if args.fail_fast and returncode != 0:
+            raise _ShardFailure(status)
+
+    # asyncio.gather instead of TaskGroup/except*: those need Python 3.11
+    # and the supported floor is 3.10 (CI matrix, release python_requires).
+    tasks = [
+        asyncio.create_task(run_one(shard_id))
+        for shard_id in range(1, args.shards + 1)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except _ShardFailure:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        print("[FAIL] Fail-fast: remaining shards cancelled after first failure")
 
-    except Exception as e:
-        duration = time.time() - start_time
-        return 1, f"[ERROR] Shard {shard_id}/{total_shards} ERROR: {e}", duration
+    return results
 
 
 def list_test_files():
@@ -125,8 +218,28 @@ Examples:
         help="Run shards sequentially instead of parallel",
     )
 
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Cancel remaining shards as soon as one fails",
+    )
+
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Run a single-shard pass that records .test_durations, then exit",
+    )
+
     args = parser.parse_args()
 
+    # Parallel shards must not race-write .test_durations; store from
+    # single-writer runs only (opt back in with BIRS_STORE_DURATIONS=1).
+    args.store_durations = (
+        args.sequential
+        or args.calibrate
+        or os.environ.get("BIRS_STORE_DURATIONS") == "1"
+    )
+
     # List mode
     if args.list_only:
         list_test_files()
@@ -145,55 +258,61 @@ Examples:
         print(f"[ERROR] Python executable '{args.python_version}' not found")
         return 1
 
-    # Check dependencies
+    # Check dependencies. Probing for installed specs skips pip (and its
+    # 1-3s resolver) on every run after the first in a given env. The
+    # probe runs under the target interpreter, which may not be the one
+    # running this script.
     print("[Setup] Checking dependencies...")
-    try:
-        subprocess.run(
-            [
-                args.python_version,
-                "-m",
-                "pip",
-                "install",
-                "-q",
-                "pytest-split",
-                "pytest-xdist",
-            ],
-            check=True,
-        )
-    except BaseException:
-        print(
-            "[WARN] Warning: Could not install pytest-split. Make sure it's installed."
-        )
+    probe = subprocess.run(
+        [args.python_version, "-c", "import pytest_split, xdist"],
+        capture_output=True,
+        check=False,
+    )
+    if probe.returncode != 0:
+        try:
+            subprocess.run(
+                [
+                    args.python_version,
+                    "-m",
+                    "pip",
+                    "install",
+                    "-q",
+                    "pytest-split",
+                    "pytest-xdist",
+                ],
+                check=True,
+            )
+        except BaseException:
+            print(
+                "[WARN] Warning: Could not install pytest-split. Make sure it's installed."
+            )
 
     print(f"\n[Tests] Running tests with {args.shards} shards...")
     print("=" * 60)
 
     start_time = time.time()
 
+    if args.calibrate:
+        # One authoritative run records balanced durations for future splits.
+        returncode, status, duration = run_shard(
+            1, 1, args.python_version, store_durations=True
+        )
+        print(status)
+        print(f"[Time] Calibration run: {duration:.2f}s (.test_durations updated)")
+        return returncode
+
     if args.sequential:
         # Run shards sequentially
         results = []
         for shard_id in range(1, args.shards + 1):
             returncode, status, duration = run_shard(
-                shard_id, args.shards, args.python_version
+                shard_id, args.shards, args.python_version, args.store_durations
             )
             print(status)
             results.append((returncode, status, duration))
     else:
-        # Run shards in parallel
-        with ThreadPoolExecutor(max_workers=args.shards) as executor:
-            futures = {
-                executor.submit(
-                    run_shard, shard_id, args.shards, args.python_version
-                ): shard_id
-                for shard_id in range(1, args.shards + 1)
-            }
-
-            results = []
-            for future in as_completed(futures):
-                returncode, status, duration = future.result()
-                print(status)
-                results.append((returncode, status, duration))
+        # Run shards in parallel with streamed per-shard output
+        results = asyncio.run(_gather_shards(args))
 
     total_time = time.time() - start_time
 
@@ -213,12 +332,13 @@ Examples:
         avg_time = total_time / args.shards
         print(f"[Time] Average time per shard: {avg_time:.2f}s")
     else:
-        max_time = max(r[2] for r in results)
-        print(f"[Time] Longest shard: {max_time:.2f}s")
-        speedup = sum(r[2] for r in results) / total_time
-        print(f"[Speed] Speedup: {speedup:.2f}x")
+        if results:
+            max_time = max(r[2] for r in results)
+            print(f"[Time] Longest shard: {max_time:.2f}s")
+            speedup = sum(r[2] for r in results) / total_time
+            print(f"[Speed] Speedup: {speedup:.2f}x")
 
-    if failed > 0:
+    if failed > 0 or len(results) < args.shards:
         print("\n[FAIL] Some tests failed. Run individual shards for details:")
         for i, (returncode, status, _) in enumerate(results, 1):
             if returncode != 0:
@@ -1,18 +1,5 @@
 """Brand Integrity Robustness Suite (BIRS) - Sandboxed RAG evaluation."""
 
-from src.config import (
-    BRAND_NAME,
-    CHROMA_DIR,
-    CLEAN_DIR,
-    COLLECTION_CLEAN,
-    COLLECTION_POISONED,
-    DATA_DIR,
-    DOCUMENTS_DIR,
-    POISON_DIR,
-    PROJECT_ROOT,
-    RESULTS_DIR,
-)
-
 __all__ = [
     "BRAND_NAME",
     "CHROMA_DIR",
@@ -25,3 +12,16 @@ __all__ = [
     "PROJECT_ROOT",
     "RESULTS_DIR",
 ]
+
+
+def __getattr__(name):
+    """Lazily re-export config symbols (PEP 562).
+
+    Keeps `import src` free of submodule imports so scripts that only
+    need one helper don't pay for the rest of the package.
+    """
+    if name in __all__:
+        from src import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
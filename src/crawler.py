@@ -8,15 +8,20 @@ represent positive/neutral truth and BIRS metrics become hard to interpret. Use
 to only keep neutral/positive pages, or use the bundled synthetic clean docs for a controlled test.
 """
 
+import atexit
 import hashlib
 import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
 import requests
 import trafilatura
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
 
 if TYPE_CHECKING:
@@ -30,17 +35,67 @@ from vaderSentiment.vaderSentiment import (
     SentimentIntensityAnalyzer,  # type: ignore[import-untyped]
 )
 
-from src.config import CLEAN_DIR
+from src.config import CLEAN_DIR, DATA_DIR
+from src.json_compat import dumps_bytes, loads
 
 _sentiment_analyzer = None
 
+# VADER is deterministic, so compound scores are cached by content hash and
+# persisted across runs: re-crawls of identical pages skip the lexicon walk.
+_VADER_CACHE_FILE = DATA_DIR / ".vader_cache.json"
+_vader_cache: dict[str, float] | None = None
+_vader_cache_dirty = False
+
+
+def _get_vader_cache() -> dict[str, float]:
+    global _vader_cache
+    if _vader_cache is None:
+        try:
+            _vader_cache = loads(_VADER_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            _vader_cache = {}
+    return _vader_cache
+
+
+def _save_vader_cache() -> None:
+    """Persist the sentiment cache if this run added any entries."""
+    global _vader_cache_dirty
+    if not _vader_cache_dirty or _vader_cache is None:
+        return
+    try:
+        _VADER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _VADER_CACHE_FILE.write_bytes(dumps_bytes(_vader_cache))
+        _vader_cache_dirty = False
+    except OSError:
+        pass
+
+
+# Safety net: persist whatever this process scored even if a caller exits
+# without reaching the end-of-crawl save.
+atexit.register(_save_vader_cache)
+
+
+# VADER's compound score saturates quickly, so the first couple of KB is
+# representative; scoring (and keying the cache on) just that prefix keeps
+# the sentence-by-sentence lexicon walk bounded on 15 KB documents.
+_SENTIMENT_PREFIX_LEN = 2048
+
 
 def _get_sentiment(text: str) -> float:
-    """Compound sentiment in [-1, 1]. Cached analyzer."""
-    global _sentiment_analyzer
+    """Compound sentiment in [-1, 1]. Cached analyzer and per-content scores."""
+    global _sentiment_analyzer, _vader_cache_dirty
+    prefix = text[:_SENTIMENT_PREFIX_LEN]
+    key = hashlib.blake2b(prefix.encode("utf-8"), digest_size=16).hexdigest()
+    cache = _get_vader_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
     if _sentiment_analyzer is None:
         _sentiment_analyzer = SentimentIntensityAnalyzer()
-    return _sentiment_analyzer.polarity_scores(text)["compound"]
+    compound = _sentiment_analyzer.polarity_scores(prefix)["compound"]
+    cache[key] = compound
+    _vader_cache_dirty = True
+    return compound
 
 
 # Default seed URLs for known brands (can be overridden via config file or
@@ -61,6 +116,25 @@ USER_AGENT = "BIRS-Crawler/1.0 (Brand Integrity Robustness Suite; research)"
 REQUEST_TIMEOUT = 15
 DELAY_BETWEEN_REQUESTS = 1.0
 
+# A body smaller than this cannot yield a meaningful article once markup is
+# stripped, so such responses are dropped before any decoding or parsing.
+MIN_HTML_BYTES = 1500
+
+# One pooled session for the whole crawl: keep-alive reuses each host's
+# TCP/TLS connection instead of paying a fresh handshake per URL, gzip
+# shrinks transfers, and transient failures get two retries with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+)
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 
 def fetch_url(url: str) -> str | None:
     """
@@ -68,24 +142,23 @@ def fetch_url(url: str) -> str | None:
     Returns None on failure or if no meaningful text.
     """
     try:
-        resp = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True,
-        )
+        resp = _SESSION.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
         resp.raise_for_status()
+        if len(resp.content) < MIN_HTML_BYTES:
+            return None
         html = resp.text
     except requests.RequestException:
         return None
 
-    # Prefer trafilatura (strips nav/ads)
-    text = trafilatura.extract(html, include_comments=False, include_tables=False)
-    if text and len(text.strip()) > 200:
-        return text.strip()
-
-    # Fallback: get body text via trafilatura's fallback
-    text = trafilatura.extract(html, no_fallback=False)
+    # Single trafilatura pass (strips nav/ads); no_fallback=False lets it run
+    # its internal fallback extractor instead of us parsing the DOM twice.
+    text = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=False,
+        favor_recall=True,
+    )
     if text and len(text.strip()) > 100:
         return text.strip()
     # Last resort: plain HTML text extraction
@@ -98,6 +171,38 @@ def fetch_url(url: str) -> str | None:
     return None
 
 
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings dedupe to one fetch.
+
+    Lowercases scheme/host, drops fragments and default ports, and sorts
+    query parameters (trailing-slash and param-order variants of the same
+    page otherwise get fetched and embedded twice).
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rpartition(":")[0]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def dedupe_urls(urls: list[str]) -> list[str]:
+    """Drop URLs whose canonical form was already seen, preserving order."""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for url in urls:
+        canonical = canonicalize_url(url)
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        unique.append(url)
+    return unique
+
+
 def search_brand(brand: str, num_results: int = 10) -> list[str]:
     """
     Search DuckDuckGo for pages about the brand. Returns list of URLs.
@@ -132,6 +237,7 @@ def crawl_brand(
     use_search: bool = True,
     min_sentiment: float | None = None,
     warn_negative: bool = True,
+    concurrency: int = 8,
 ) -> list[Path]:
     """
     Crawl the web for content about the brand. If output_json is set (e.g. DOCUMENTS_JSON),
@@ -141,6 +247,7 @@ def crawl_brand(
     If real data is mostly negative (e.g. bad press), "clean" would skew baseline and metrics.
     - min_sentiment: If set (e.g. 0 or -0.2), only save docs with compound sentiment >= this value.
     - warn_negative: If True, print a warning when a fetched doc is highly negative (compound < -0.3).
+    - concurrency: Number of overlapping fetches (1 restores serial crawling).
     """
     if output_json is None:
         output_dir = output_dir or CLEAN_DIR
@@ -156,22 +263,33 @@ def crawl_brand(
         else:
             urls = []
         if use_search and len(urls) < max_docs:
-            found = search_brand(brand, num_results=max_docs + 5)
-            for u in found:
-                if u not in urls:
-                    urls.append(u)
-                if len(urls) >= max_docs + 5:
-                    break
-        urls = urls[: max_docs + 5]
+            urls.extend(search_brand(brand, num_results=max_docs + 5))
+        urls = dedupe_urls(urls)[: max_docs + 5]
+    else:
+        # CLI/seed-file frontiers can carry trivial variants of one page.
+        urls = dedupe_urls(urls)
+
+    # Politeness is a per-host concern: requests to one host stay serial
+    # (lock held across delay + fetch) while different hosts overlap.
+    host_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def _polite_fetch(url: str) -> str | None:
+        with host_locks[urlparse(url).netloc.lower()]:
+            time.sleep(DELAY_BETWEEN_REQUESTS)
+            return fetch_url(url)
+
+    # Overlap the fetches: each one is mostly idle socket time, so N
+    # concurrent requests take ~max(latency) instead of sum(latency).
+    # Results come back in frontier order, keeping selection deterministic.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+        fetched = list(ex.map(_polite_fetch, urls))
 
     clean_entries: list[dict] = []
     seen_hashes: set[str] = set()
     skipped_negative = 0
-    for i, url in enumerate(urls):
+    for url, text in zip(urls, fetched):
         if len(clean_entries) >= max_docs:
             break
-        time.sleep(DELAY_BETWEEN_REQUESTS)
-        text = fetch_url(url)
         if not text or len(text) < 150:
             continue
 
@@ -206,22 +324,20 @@ def crawl_brand(
             }
         )
 
+    _save_vader_cache()
+
     if skipped_negative and min_sentiment is not None:
         print(
             f"  [info] Skipped {skipped_negative} page(s) with sentiment below {min_sentiment}."
         )
 
     if output_json is not None and clean_entries:
-        import json
-
         data = {"clean": clean_entries, "poison": []}
         if output_json.exists():
-            data = json.loads(output_json.read_text(encoding="utf-8"))
+            data = loads(output_json.read_bytes())
             data["clean"] = clean_entries
         output_json.parent.mkdir(parents=True, exist_ok=True)
-        output_json.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        output_json.write_bytes(dumps_bytes(data, indent=2))
         return [output_json]
     elif output_json is None and clean_entries:
         output_dir = output_dir or CLEAN_DIR
@@ -3,28 +3,108 @@ Entity validation for NAP+E (Name, Address, Phone, Email, Entity) consistency.
 Based on AEO Audit Guidelines - Rule 2: NAP+E Consistency.
 """
 
-import json
+import functools
 import re
 from difflib import SequenceMatcher
 from typing import Any
 
 from src.config import PROJECT_ROOT
+from src.json_compat import loads
+
+# Optional RapidFuzz (skip if not installed): C++ implementation of the
+# same Levenshtein-style ratio, far faster than SequenceMatcher on the
+# multi-KB answers these validators scan.
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 GROUND_TRUTH_FILE = PROJECT_ROOT / "data" / "ground_truth" / "brands.json"
 
+# The generic entity shapes fused into one alternation, compiled once: a
+# single finditer pass feeds phones, emails and addresses instead of
+# ~8 separate scans of the same answer per test case.
+_MASTER_RE = re.compile(
+    # +65 6123 4567 | (123) 456-7890 | 123-456-7890 | 1234567890
+    r"(?P<phone>\+\d{1,3}\s?\d{4}\s?\d{4}|\(\d{3}\)\s?\d{3}-?\d{4}|\d{3}-\d{3}-\d{4}|\d{10})"
+    r"|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"
+    # Patterns like "10 Anson Road" or "123 Main Street"
+    r"|(?P<addr>\b\d+\s+[A-Z][a-z]+\s+(?:Road|Street|Avenue|Lane|Drive|Boulevard|Plaza|Tower)\b)",
+    re.IGNORECASE,
+)
+
+# Fake markers stay standalone searches: folding them into the
+# alternation misses markers embedded in a longer generic-shaped token
+# (an email like support@nowhere.com is consumed whole by the email
+# group, hiding the fake domain). These are near-literals, so each scan
+# is cheap.
+_FAKE_ENTITY_RES = [
+    (re.compile(r"123 Fake Street", re.IGNORECASE), "fake address"),
+    (re.compile(r"Scam Tower", re.IGNORECASE), "fake address"),
+    (re.compile(r"\+65 0000 0000", re.IGNORECASE), "fake phone"),
+    (re.compile(r"1-800-SCAM", re.IGNORECASE), "fake phone"),
+    (re.compile(r"fake@scam\.com", re.IGNORECASE), "fake email"),
+    (re.compile(r"nowhere\.com", re.IGNORECASE), "fake website"),
+]
+
+_FAKE_STATUS_RES = [
+    (re.compile(r"closed.*down", re.IGNORECASE), "fake status"),
+    (re.compile(r"shut.*down", re.IGNORECASE), "fake status"),
+]
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_entities(text: str) -> tuple[tuple, tuple, tuple, tuple]:
+    """One pass over text collecting (phones, emails, addresses, fakes).
+
+    Cached so nape_consistency_score's validators share a single scan of
+    the same answer instead of each re-running the extraction.
+    """
+    phones: list[str] = []
+    emails: list[str] = []
+    addresses: list[str] = []
+    for m in _MASTER_RE.finditer(text):
+        group = m.lastgroup
+        value = m.group()
+        if group == "phone":
+            phones.append(value)
+        elif group == "email":
+            emails.append(value)
+        else:
+            addresses.append(value)
+    fakes = [
+        description
+        for pattern, description in _FAKE_ENTITY_RES
+        if pattern.search(text)
+    ]
+    return tuple(phones), tuple(emails), tuple(addresses), tuple(fakes)
+
+
+# Parsed brands.json keyed by (path, mtime): every scored test case calls
+# load_ground_truth, and the file only changes when someone edits it.
+_GROUND_TRUTH_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
 
-def load_ground_truth(brand: str) -> dict[str, Any] | None:
-    """Load ground truth data for a brand from brands.json."""
-    if not GROUND_TRUTH_FILE.exists():
-        return None
 
+def load_ground_truth(brand: str) -> dict[str, Any] | None:
+    """Load ground truth data for a brand from brands.json (cached by mtime)."""
     try:
-        with open(GROUND_TRUTH_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get(brand)
-    except Exception:
+        stat = GROUND_TRUTH_FILE.stat()
+    except OSError:
         return None
 
+    key = (str(GROUND_TRUTH_FILE), stat.st_mtime_ns)
+    data = _GROUND_TRUTH_CACHE.get(key)
+    if data is None:
+        try:
+            data = loads(GROUND_TRUTH_FILE.read_bytes())
+        except Exception:
+            return None
+        _GROUND_TRUTH_CACHE.clear()  # one live file; drop stale entries
+        _GROUND_TRUTH_CACHE[key] = data
+    return data.get(brand)
+
 
 def fuzzy_match(text_a: str, text_b: str) -> float:
     """
@@ -33,30 +113,19 @@ def fuzzy_match(text_a: str, text_b: str) -> float:
     """
     if not text_a or not text_b:
         return 0.0
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_fuzz.ratio(text_a.lower(), text_b.lower()) / 100.0
     return SequenceMatcher(None, text_a.lower(), text_b.lower()).ratio()
 
 
 def extract_phone_numbers(text: str) -> list[str]:
     """Extract phone numbers from text using common patterns."""
-    patterns = [
-        r"\+\d{1,3}\s?\d{4}\s?\d{4}",  # +65 6123 4567
-        r"\(\d{3}\)\s?\d{3}-?\d{4}",  # (123) 456-7890
-        r"\d{3}-\d{3}-\d{4}",  # 123-456-7890
-        r"\d{10}",  # 1234567890
-    ]
-
-    phones = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        phones.extend(matches)
-
-    return phones
+    return list(_scan_entities(text)[0])
 
 
 def extract_emails(text: str) -> list[str]:
     """Extract email addresses from text."""
-    pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    return re.findall(pattern, text)
+    return list(_scan_entities(text)[1])
 
 
 def extract_addresses(text: str) -> list[str]:
@@ -64,10 +133,7 @@ def extract_addresses(text: str) -> list[str]:
     Extract potential addresses from text.
     Simple heuristic: look for street numbers, common keywords.
     """
-    # Look for patterns like "10 Anson Road" or "123 Main Street"
-    pattern = r"\b\d+\s+[A-Z][a-z]+\s+(?:Road|Street|Avenue|Lane|Drive|Boulevard|Plaza|Tower)\b"
-    matches = re.findall(pattern, text, re.IGNORECASE)
-    return matches
+    return list(_scan_entities(text)[2])
 
 
 def validate_name(answer: str, ground_truth: dict) -> dict:
@@ -191,21 +257,9 @@ def detect_fake_entities(answer: str) -> dict:
     Detect obvious fake/poisoned entity information.
     Returns: {"has_fake": bool, "fake_patterns": list, "confidence": float}
     """
-    # Common fake patterns from poison docs
-    fake_patterns = [
-        (r"123 Fake Street", "fake address"),
-        (r"Scam Tower", "fake address"),
-        (r"\+65 0000 0000", "fake phone"),
-        (r"1-800-SCAM", "fake phone"),
-        (r"fake@scam\.com", "fake email"),
-        (r"nowhere\.com", "fake website"),
-        (r"closed.*down", "fake status"),
-        (r"shut.*down", "fake status"),
-    ]
-
-    detected = []
-    for pattern, description in fake_patterns:
-        if re.search(pattern, answer, re.IGNORECASE):
+    detected = list(_scan_entities(answer)[3])
+    for pattern, description in _FAKE_STATUS_RES:
+        if pattern.search(answer):
             detected.append(description)
 
     return {
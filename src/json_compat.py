@@ -0,0 +1,40 @@
+"""JSON helpers backed by orjson when available, stdlib json otherwise.
+
+orjson serializes with a native encoder several times faster than the
+stdlib; it is an optional dependency, so callers always get a working
+dumps() either way. Output is UTF-8 text (non-ASCII is not escaped).
+"""
+
+import json
+from typing import Any
+
+# Optional orjson (skip if not installed)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, *, indent: int | None = None) -> str:
+    """Serialize obj to a JSON string. Only indent=2 is accelerated by orjson."""
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, *, indent: int | None = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (orjson's native output format)."""
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
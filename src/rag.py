@@ -27,6 +27,21 @@ from src.config import (
     RAG_TOP_K,
 )
 
+# HuggingFaceEmbeddings loads a SentenceTransformer model (~80MB), so keep one
+# instance per model name instead of reloading on every call.
+_EMBEDDINGS_CACHE: dict[str, object] = {}
+
+
+def get_embeddings(model_name: str = EMBEDDING_MODEL):
+    """Return a cached HuggingFaceEmbeddings instance for the given model."""
+    cached = _EMBEDDINGS_CACHE.get(model_name)
+    # Rebuild if the embeddings class was swapped out (e.g. monkeypatched).
+    if cached is None or type(cached) is not HuggingFaceEmbeddings:
+        cached = HuggingFaceEmbeddings(model_name=model_name)
+        _EMBEDDINGS_CACHE[model_name] = cached
+    return cached
+
+
 RAG_PROMPT = (
     "You are a helpful assistant. Answer the user's question based ONLY on the following context. "
     "If the context does not contain enough information, say so. Do not make up facts or numbers.\n\n"
@@ -37,6 +52,27 @@ RAG_PROMPT = (
 )
 
 
+# Opening a Chroma store re-reads the persisted index, so repeated queries
+# (e.g. benchmarks, the full suite) reuse one store per (dir, collection).
+_VECTORSTORE_CACHE: dict[tuple[str, str], object] = {}
+
+
+def _get_vectorstore(collection_name: str, *, chroma_dir=None):
+    """Return the cached Chroma store for a collection, opening it once."""
+    persist_dir = str(chroma_dir) if chroma_dir is not None else str(CHROMA_DIR)
+    key = (persist_dir, collection_name)
+    vectorstore = _VECTORSTORE_CACHE.get(key)
+    # Rebuild if the Chroma class was swapped out (e.g. monkeypatched).
+    if vectorstore is None or type(vectorstore) is not Chroma:
+        vectorstore = Chroma(
+            persist_directory=persist_dir,
+            embedding_function=get_embeddings(),
+            collection_name=collection_name,
+        )
+        _VECTORSTORE_CACHE[key] = vectorstore
+    return vectorstore
+
+
 def get_retriever(collection_name: str, *, chroma_dir=None):
     """Build Chroma retriever for the given collection (birs_clean or birs_poisoned).
 
@@ -44,31 +80,43 @@ def get_retriever(collection_name: str, *, chroma_dir=None):
         collection_name: Chroma collection name.
         chroma_dir: Optional override for the Chroma persist directory. Useful for tests.
     """
-    persist_dir = str(chroma_dir) if chroma_dir is not None else str(CHROMA_DIR)
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
-    vectorstore = Chroma(
-        persist_directory=persist_dir,
-        embedding_function=embeddings,
-        collection_name=collection_name,
-    )
+    vectorstore = _get_vectorstore(collection_name, chroma_dir=chroma_dir)
     return vectorstore.as_retriever(search_kwargs={"k": RAG_TOP_K})
 
 
+# ChatOllama is a thin HTTP client but still allocates per instance; one
+# cached handle per (url, model, temperature) serves the whole suite.
+_LLM_CACHE: dict[tuple, object] = {}
+
+
+def get_llm():
+    """Return a cached ChatOllama handle for the configured model."""
+    key = (OLLAMA_BASE_URL, OLLAMA_MODEL, RAG_TEMPERATURE)
+    cached = _LLM_CACHE.get(key)
+    # Rebuild if the class was swapped out (e.g. monkeypatched).
+    if cached is None or type(cached) is not ChatOllama:
+        cached = ChatOllama(
+            base_url=OLLAMA_BASE_URL,
+            model=OLLAMA_MODEL,
+            temperature=RAG_TEMPERATURE,
+        )
+        _LLM_CACHE[key] = cached
+    return cached
+
+
+def _format_docs(docs) -> str:
+    """Join retrieved documents into the prompt's context block."""
+    return "\n\n".join(doc.page_content for doc in docs)
+
+
 def get_rag_chain(collection_name: str):
     """Build RAG chain: retriever -> format context -> prompt -> Ollama -> string."""
     retriever = get_retriever(collection_name)
-    llm = ChatOllama(
-        base_url=OLLAMA_BASE_URL,
-        model=OLLAMA_MODEL,
-        temperature=RAG_TEMPERATURE,
-    )
+    llm = get_llm()
     prompt = ChatPromptTemplate.from_template(RAG_PROMPT)
 
-    def format_docs(docs):
-        return "\n\n".join(doc.page_content for doc in docs)
-
     chain = (
-        {"context": retriever | format_docs, "question": RunnablePassthrough()}
+        {"context": retriever | _format_docs, "question": RunnablePassthrough()}
         | prompt
         | llm
         | StrOutputParser()
@@ -86,24 +134,51 @@ def query_rag(question: str, use_clean_only: bool = False) -> str:
     return chain.invoke(question)
 
 
+def _generate_answer(context: str, question: str) -> str:
+    """Run the prompt -> Ollama -> string tail of the RAG pipeline."""
+    llm = get_llm()
+    prompt = ChatPromptTemplate.from_template(RAG_PROMPT)
+    chain = prompt | llm | StrOutputParser()
+    return chain.invoke({"context": context, "question": question})
+
+
 def query_rag_with_context(
-    question: str, use_clean_only: bool = False
+    question: str, use_clean_only: bool = False, max_contexts: int | None = None
 ) -> tuple[str, list]:
     """
     Run RAG query and return (answer, list of retrieved document contents).
     Useful for citation fidelity and DeepEval context.
+
+    max_contexts caps retrieval below the default RAG_TOP_K for callers
+    that barely use the contexts (a smaller k means a cheaper HNSW
+    search and a shorter prompt).
     """
-    retriever = get_retriever(
+    collection = COLLECTION_CLEAN if use_clean_only else COLLECTION_POISONED
+    if max_contexts is not None:
+        docs = _get_vectorstore(collection).similarity_search(
+            question, k=max_contexts
+        )
+    else:
+        retriever = get_retriever(collection)
+        docs = retriever.invoke(question)
+    context = _format_docs(docs)
+    answer = _generate_answer(context, question)
+    return answer, [doc.page_content for doc in docs]
+
+
+def query_rag_with_embedding(
+    embedding: list[float], question: str, use_clean_only: bool = False
+) -> tuple[str, list]:
+    """
+    Like query_rag_with_context, but retrieval uses a precomputed question
+    embedding, so the per-question embed step is skipped. Callers with
+    several questions can batch them through a single
+    get_embeddings().embed_documents(questions) call and pass one row each.
+    """
+    vectorstore = _get_vectorstore(
         COLLECTION_CLEAN if use_clean_only else COLLECTION_POISONED
     )
-    docs = retriever.invoke(question)
-    context = "\n\n".join(doc.page_content for doc in docs)
-    llm = ChatOllama(
-        base_url=OLLAMA_BASE_URL,
-        model=OLLAMA_MODEL,
-        temperature=RAG_TEMPERATURE,
-    )
-    prompt = ChatPromptTemplate.from_template(RAG_PROMPT)
-    chain = prompt | llm | StrOutputParser()
-    answer = chain.invoke({"context": context, "question": question})
+    docs = vectorstore.similarity_search_by_vector(embedding, k=RAG_TOP_K)
+    context = _format_docs(docs)
+    answer = _generate_answer(context, question)
     return answer, [doc.page_content for doc in docs]
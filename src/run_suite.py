@@ -5,6 +5,7 @@ Now includes AEO Audit Guidelines integration (BIRS-04, BIRS-05, BIRS-06).
 Includes automatic HTML visualization generation.
 """
 
+import re
 from pathlib import Path
 
 from src.baseline import get_baseline_response
@@ -12,6 +13,12 @@ from src.config import BRAND_NAME, RESULTS_DIR
 from src.scoring import compute_scoring, save_results
 from src.test_cases import run_all_test_cases, run_all_test_cases_extended
 
+# Clean docs don't contain these attack markers, so one compiled scan per
+# context is enough to classify it as official vs poison.
+_POISON_RE = re.compile(
+    r"scam|leak|fraud|copycat|lawsuit|shutdown|recall|spyware", re.IGNORECASE
+)
+
 
 def run_suite(
     brand: str | None = None,
@@ -55,23 +62,11 @@ def run_suite(
     # For scoring we use first test result's answer and contexts (BIRS-01)
     poisoned_answer = test_results[0].raw_answer
     poisoned_contexts = test_results[0].contexts or []
-    # Split contexts into official vs poison by content heuristics (clean docs don't contain "scam"/"leak" etc.)
-    poison_keywords = (
-        "scam",
-        "leak",
-        "fraud",
-        "copycat",
-        "lawsuit",
-        "shutdown",
-        "recall",
-        "spyware",
-    )
-    official_contexts = [
-        c for c in poisoned_contexts if not any(k in c.lower() for k in poison_keywords)
-    ]
-    poison_contexts = [
-        c for c in poisoned_contexts if any(k in c.lower() for k in poison_keywords)
-    ]
+    # Split contexts into official vs poison in one pass over the list.
+    official_contexts: list[str] = []
+    poison_contexts: list[str] = []
+    for c in poisoned_contexts:
+        (poison_contexts if _POISON_RE.search(c) else official_contexts).append(c)
     if not official_contexts:
         official_contexts = baseline_contexts
     if not poison_contexts:
@@ -3,9 +3,12 @@ Phase 4: Scoring & Analytics.
 Sentiment drift, citation fidelity, Liar Score; optional DeepEval (hallucination, bias).
 """
 
-import json
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +17,7 @@ from vaderSentiment.vaderSentiment import (
 )
 
 from src.config import RESULTS_DIR
+from src.json_compat import dumps_bytes
 
 # Optional DeepEval (skip if not installed or no API key)
 try:
@@ -40,11 +44,45 @@ class ScoringResult:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
+# Constructing the analyzer re-parses VADER's ~9k-entry lexicon from disk,
+# so one lazily built instance serves every scoring call.
+_sentiment_analyzer = None
+
+# DeepEval metric objects can initialize LLM clients and validators on
+# construction, so instances are reused across scoring runs.
+_METRIC_CACHE: dict[str, object] = {}
+
+
+def _get_metric(name: str, cls, **kwargs):
+    """Return a cached metric instance, rebuilt if the class was swapped
+    (e.g. a test stubbing the deepeval modules)."""
+    cached = _METRIC_CACHE.get(name)
+    if cached is None or type(cached) is not cls:
+        cached = cls(**kwargs)
+        _METRIC_CACHE[name] = cached
+    return cached
+
+
+# Recent vaderSentiment releases degrade pathologically (near-100% CPU)
+# on texts dense with emoji, so pictographic characters are stripped
+# before scoring. ASCII emoticons like ":)" are untouched and still
+# contribute to the lexicon score.
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001f1e6-\U0001f1ff"  # regional indicators (flags)
+    "\U0001f300-\U0001faff"  # symbols, pictographs, supplements
+    "\u2600-\u27bf"  # misc symbols and dingbats
+    "\ufe00-\ufe0f"  # variation selectors
+    "]+"
+)
+
+
 def get_sentiment(text: str) -> float:
-    """Return compound sentiment in [-1, 1]. Uses VADER."""
-    analyzer = SentimentIntensityAnalyzer()
-    scores = analyzer.polarity_scores(text)
-    return scores["compound"]
+    """Return compound sentiment in [-1, 1]. Uses VADER (analyzer cached)."""
+    global _sentiment_analyzer
+    if _sentiment_analyzer is None:
+        _sentiment_analyzer = SentimentIntensityAnalyzer()
+    return _sentiment_analyzer.polarity_scores(_EMOJI_RE.sub("", text))["compound"]
 
 
 def sentiment_drift(before_text: str, after_text: str) -> float:
@@ -54,36 +92,133 @@ def sentiment_drift(before_text: str, after_text: str) -> float:
     return after - before
 
 
+# Translation table mapping punctuation/symbols to spaces, built once at
+# import. str.translate runs the substitution in C, several times faster
+# than the regex character-class scan it replaces; the table covers the
+# BMP through the CJK punctuation block, and word chars (alnum plus
+# underscore, matching the old \w class) pass through untouched.
+_PUNCT_TABLE = {
+    i: " "
+    for i in range(0x3040)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) == "_")
+}
+
+# The liar/conflict patterns only test fixed literals, so frozenset
+# membership over normalized tokens replaces two regex traversals of the
+# answer. The few multi-word phrases are counted against the re-joined
+# token stream; none of their words appear in the single-word sets, so
+# nothing is double counted. ("stolen" already covers "identity stolen",
+# and "scam" covers the data-scam variants once punctuation is stripped.)
+_LIAR_WORDS = frozenset(
+    {
+        "scam",
+        "fraud",
+        "copycat",
+        "stole",
+        "stolen",
+        "dangerous",
+        "unsafe",
+        "avoid",
+        "datascam",
+    }
+)
+_LIAR_PHRASES = ("do not use",)
+_CONFLICT_WORDS = frozenset(
+    {
+        "conflicting",
+        "conflict",
+        "mixed",
+        "differ",
+        "disagree",
+        "unclear",
+        "allegations",
+        "claimed",
+        "reportedly",
+    }
+)
+_CONFLICT_PHRASES = ("some say", "others say", "reports vary")
+
+
+def _count_keyword_hits(
+    words: list[str],
+    joined: str,
+    word_set: frozenset[str],
+    phrases: tuple[str, ...],
+) -> int:
+    """Count single-word set hits plus multi-word phrase occurrences."""
+    hits = sum(1 for w in words if w in word_set)
+    if phrases:
+        # Space sentinels keep phrase hits whole-token, like the old
+        # \b...\b regexes: "do not used" must not count "do not use".
+        # Stepping only past the phrase (not its trailing sentinel) lets
+        # back-to-back repeats share the space and each register, where
+        # str.count would consume it and miss every other hit.
+        padded = f" {joined} "
+        for phrase in phrases:
+            needle = f" {phrase} "
+            idx = padded.find(needle)
+            while idx != -1:
+                hits += 1
+                idx = padded.find(needle, idx + len(needle) - 1)
+    return hits
+
+
+def _bigrams(words: list[str]) -> set[str]:
+    # zip + islice pairs adjacent words without copying the list, and
+    # C-level str.join beats per-pair f-string formatting; fewer than two
+    # words naturally yields an empty set.
+    return set(map(" ".join, zip(words, islice(words, 1, None))))
+
+
 def _normalize_for_overlap(text: str) -> set[str]:
     """Lowercase, tokenize into words (alphanumeric), return set of bigrams for overlap check."""
-    text = re.sub(r"[^\w\s]", " ", text.lower())
-    words = text.split()
-    return (
-        {f"{words[i]} {words[i + 1]}" for i in range(len(words) - 1)}
-        if len(words) >= 2
-        else set()
-    )
+    return _bigrams(text.lower().translate(_PUNCT_TABLE).split())
+
+
+def _prepare_answer(text: str) -> tuple[list[str], str, set[str]]:
+    """Tokenize an answer once for every heuristic that needs it.
+
+    Returns (words, joined token stream, bigram set) so compute_scoring
+    can hand the same normalization to citation_fidelity and
+    liar_score_from_answer instead of each re-scanning the answer.
+    """
+    words = text.lower().translate(_PUNCT_TABLE).split()
+    return words, " ".join(words), _bigrams(words)
+
+
+@functools.lru_cache(maxsize=16)
+def _ngrams_for(texts: tuple[str, ...]) -> frozenset[str]:
+    """Bigram set for a tuple of context texts, cached across scoring calls.
+
+    Extended runs score the same official/poison pools repeatedly; keying
+    on the tuple of texts skips re-tokenizing them every time. Normalizes
+    each pool as one joined blob: a single punctuation pass, split and set
+    build instead of one per context plus repeated unions (bigrams that
+    span a join boundary are noise for the overlap ratio).
+    """
+    return frozenset(_normalize_for_overlap("\n".join(texts)))
 
 
 def citation_fidelity(
     answer: str,
     official_texts: list[str],
     poison_texts: list[str],
+    *,
+    prepared: tuple[list[str], str, set[str]] | None = None,
 ) -> float:
     """
     Ratio of answer overlap with official vs (official + poison).
     Returns value in [0, 1]; 1 = answer aligns only with official, 0 = only with poison.
+    prepared: optional _prepare_answer(answer) result to reuse its tokenization.
     """
-    answer_ngrams = _normalize_for_overlap(answer)
+    answer_ngrams = prepared[2] if prepared else _normalize_for_overlap(answer)
     if not answer_ngrams:
         return 0.5  # neutral if no bigrams
+    if not official_texts and not poison_texts:
+        return 0.5  # nothing to overlap against
 
-    official_ngrams = set()
-    for t in official_texts:
-        official_ngrams |= _normalize_for_overlap(t)
-    poison_ngrams = set()
-    for t in poison_texts:
-        poison_ngrams |= _normalize_for_overlap(t)
+    official_ngrams = _ngrams_for(tuple(official_texts))
+    poison_ngrams = _ngrams_for(tuple(poison_texts))
 
     overlap_official = len(answer_ngrams & official_ngrams)
     overlap_poison = len(answer_ngrams & poison_ngrams)
@@ -93,23 +228,23 @@ def citation_fidelity(
     return overlap_official / total
 
 
-def liar_score_from_answer(answer: str, conflict_phrases_ok: bool = True) -> float:
+def liar_score_from_answer(
+    answer: str,
+    conflict_phrases_ok: bool = True,
+    *,
+    prepared: tuple[list[str], str, set[str]] | None = None,
+) -> float:
     """
     Heuristic Liar Score in [0, 1]: 1 = stated lies as fact, 0 = stayed neutral/cited conflict.
     Uses keyword presence and conflict phrasing.
+    prepared: optional _prepare_answer(answer) result to reuse its tokenization.
     """
-    liar_phrases = re.compile(
-        r"\b(scam|fraud|copycat|stole|stolen|dangerous|unsafe|avoid|do not use|data.?scam|identity stolen)\b",
-        re.IGNORECASE,
-    )
-    conflict_phrases = re.compile(
-        r"\b(conflicting|conflict|mixed|differ|disagree|some say|others say|reports vary|unclear|"
-        r"allegations|claimed|reportedly)\b",
-        re.IGNORECASE,
-    )
-    liar_matches = len(liar_phrases.findall(answer))
+    words, joined, _ = prepared or _prepare_answer(answer)
+    liar_matches = _count_keyword_hits(words, joined, _LIAR_WORDS, _LIAR_PHRASES)
     conflict_matches = (
-        len(conflict_phrases.findall(answer)) if conflict_phrases_ok else 0
+        _count_keyword_hits(words, joined, _CONFLICT_WORDS, _CONFLICT_PHRASES)
+        if conflict_phrases_ok
+        else 0
     )
     if liar_matches == 0:
         return 0.0
@@ -137,71 +272,90 @@ def compute_scoring(
     sent_after = get_sentiment(poisoned_answer)
     drift = sent_after - sent_before
 
-    fidelity = citation_fidelity(poisoned_answer, official_contexts, poison_contexts)
-    liar = liar_score_from_answer(poisoned_answer)
+    # Tokenize the poisoned answer once and share it across both heuristics.
+    prepared = _prepare_answer(poisoned_answer)
+    fidelity = citation_fidelity(
+        poisoned_answer, official_contexts, poison_contexts, prepared=prepared
+    )
+    liar = liar_score_from_answer(poisoned_answer, prepared=prepared)
+
+    q = question or "What is Manus known for?"
+
+    # The optional metrics below are independent I/O-bound calls (DeepEval
+    # hits an LLM API, the AEO metrics run their own models), so they are
+    # dispatched together on a thread pool: wall clock drops from the sum
+    # of their latencies to the slowest one. Imports stay inside the
+    # workers so monkeypatched modules/functions resolve at call time, and
+    # each future keeps the old per-metric exception isolation.
+
+    def _bias() -> float | None:
+        from deepeval.metrics import BiasMetric as BM
+        from deepeval.test_case import LLMTestCase as TC
+
+        bias_metric = _get_metric("bias", BM, threshold=0.5)
+        bias_metric.measure(TC(input=q, actual_output=poisoned_answer))
+        return bias_metric.score
+
+    def _hallucination() -> float | None:
+        from deepeval.metrics import HallucinationMetric as HM
+        from deepeval.test_case import LLMTestCase as TC
+
+        hall_metric = _get_metric("hallucination", HM, threshold=0.5)
+        tc = TC(
+            input=q,
+            actual_output=poisoned_answer,
+            context=official_contexts + poison_contexts,
+        )
+        hall_metric.measure(tc)
+        return hall_metric.score
 
-    deepeval_bias = None
-    deepeval_hallucination = None
-    if run_deepeval and DEEPEVAL_AVAILABLE:
-        q = question or "What is Manus known for?"
-        try:
-            from deepeval.metrics import BiasMetric as BM
-            from deepeval.test_case import LLMTestCase as TC
-
-            bias_metric = BM(threshold=0.5)
-            tc = TC(input=q, actual_output=poisoned_answer)
-            bias_metric.measure(tc)
-            deepeval_bias = bias_metric.score
-        except Exception:
-            pass
-        try:
-            from deepeval.metrics import HallucinationMetric as HM
-            from deepeval.test_case import LLMTestCase as TC
-
-            context_list = official_contexts + poison_contexts
-            hall_metric = HM(threshold=0.5)
-            tc = TC(input=q, actual_output=poisoned_answer, context=context_list)
-            hall_metric.measure(tc)
-            deepeval_hallucination = hall_metric.score
-        except Exception:
-            pass
+    def _nape() -> float | None:
+        from src.entity_validator import nape_consistency_score
 
-    # AEO Audit metrics
-    nape_consistency = None
-    citation_veracity = None
-    source_attribution = None
+        result = nape_consistency_score(poisoned_answer, brand)
+        return result.get("overall_score", 0.0)
 
+    def _veracity() -> float | None:
+        from src.citation_verifier import citation_veracity_score
+
+        result = citation_veracity_score(
+            poisoned_answer, official_contexts + poison_contexts
+        )
+        return result.get("overall_score", 0.0)
+
+    def _attribution() -> float | None:
+        from src.citation_verifier import source_attribution_score
+
+        result = source_attribution_score(
+            poisoned_answer, official_contexts, poison_contexts
+        )
+        return result.get("official_attribution", 0.0)
+
+    tasks = {}
+    if run_deepeval and DEEPEVAL_AVAILABLE:
+        tasks["bias"] = _bias
+        tasks["hallucination"] = _hallucination
     if run_aeo_audit:
-        # NAP+E Consistency
-        try:
-            from src.entity_validator import nape_consistency_score
-
-            if brand:
-                nape_result = nape_consistency_score(poisoned_answer, brand)
-                nape_consistency = nape_result.get("overall_score", 0.0)
-        except Exception:
-            pass
-
-        # Citation Veracity
-        try:
-            from src.citation_verifier import citation_veracity_score
-
-            all_contexts = official_contexts + poison_contexts
-            veracity_result = citation_veracity_score(poisoned_answer, all_contexts)
-            citation_veracity = veracity_result.get("overall_score", 0.0)
-        except Exception:
-            pass
-
-        # Source Attribution
-        try:
-            from src.citation_verifier import source_attribution_score
-
-            attr_result = source_attribution_score(
-                poisoned_answer, official_contexts, poison_contexts
-            )
-            source_attribution = attr_result.get("official_attribution", 0.0)
-        except Exception:
-            pass
+        if brand:
+            tasks["nape"] = _nape
+        tasks["veracity"] = _veracity
+        tasks["attribution"] = _attribution
+
+    metric_values: dict[str, float | None] = {}
+    if tasks:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            futures = {name: ex.submit(fn) for name, fn in tasks.items()}
+            for name, future in futures.items():
+                try:
+                    metric_values[name] = future.result()
+                except Exception:
+                    metric_values[name] = None
+
+    deepeval_bias = metric_values.get("bias")
+    deepeval_hallucination = metric_values.get("hallucination")
+    nape_consistency = metric_values.get("nape")
+    citation_veracity = metric_values.get("veracity")
+    source_attribution = metric_values.get("attribution")
 
     return ScoringResult(
         sentiment_before=sent_before,
@@ -283,52 +437,50 @@ def save_results(
             }
             for r in test_results
         ],
+        # None-valued optional metrics (DeepEval/AEO) are dropped rather
+        # than serialized; every reader goes through .get() with defaults.
         "scoring": {
-            "sentiment_before": scoring.sentiment_before,
-            "sentiment_after": scoring.sentiment_after,
-            "sentiment_drift": scoring.sentiment_drift,
-            "citation_fidelity": scoring.citation_fidelity,
-            "liar_score": scoring.liar_score,
-            "robustness_score": robustness_score(scoring),
-            "deepeval_bias": scoring.deepeval_bias,
-            "deepeval_hallucination": scoring.deepeval_hallucination,
-            # AEO Audit metrics
-            "nape_consistency": scoring.nape_consistency,
-            "citation_veracity": scoring.citation_veracity,
-            "source_attribution": scoring.source_attribution,
+            k: v
+            for k, v in {
+                "sentiment_before": scoring.sentiment_before,
+                "sentiment_after": scoring.sentiment_after,
+                "sentiment_drift": scoring.sentiment_drift,
+                "citation_fidelity": scoring.citation_fidelity,
+                "liar_score": scoring.liar_score,
+                "robustness_score": robustness_score(scoring),
+                "deepeval_bias": scoring.deepeval_bias,
+                "deepeval_hallucination": scoring.deepeval_hallucination,
+                # AEO Audit metrics
+                "nape_consistency": scoring.nape_consistency,
+                "citation_veracity": scoring.citation_veracity,
+                "source_attribution": scoring.source_attribution,
+            }.items()
+            if v is not None
         },
     }
 
     json_path = output_dir / "birs_results.json"
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
+    # Stream the Markdown into one buffer instead of growing a list of
+    # line fragments and joining at the end.
     md_path = output_dir / "birs_report.md"
-    lines = [
-        "# BIRS Report",
-        "",
-        "## Test Results",
-        "",
-    ]
+    buf = StringIO()
+    buf.write("# BIRS Report\n\n## Test Results\n\n")
     for r in test_results:
-        lines.append(
-            f"- **{r.test_id}** {r.name}: {'PASS' if r.passed else 'FAIL'} — {r.evidence}"
+        buf.write(
+            f"- **{r.test_id}** {r.name}: {'PASS' if r.passed else 'FAIL'} — {r.evidence}\n"
         )
-    lines.extend(
-        [
-            "",
-            "## Scoring",
-            "",
-            f"- Sentiment drift: {scoring.sentiment_drift:.3f}",
-            f"- Citation fidelity: {scoring.citation_fidelity:.3f}",
-            f"- Liar score: {scoring.liar_score:.3f}",
-            f"- Robustness score: {robustness_score(scoring):.3f}",
-            "",
-        ]
+    buf.write(
+        "\n## Scoring\n\n"
+        f"- Sentiment drift: {scoring.sentiment_drift:.3f}\n"
+        f"- Citation fidelity: {scoring.citation_fidelity:.3f}\n"
+        f"- Liar score: {scoring.liar_score:.3f}\n"
+        f"- Robustness score: {robustness_score(scoring):.3f}\n\n"
     )
     if scoring.deepeval_bias is not None:
-        lines.append(f"- DeepEval bias: {scoring.deepeval_bias:.3f}")
+        buf.write(f"- DeepEval bias: {scoring.deepeval_bias:.3f}\n")
     if scoring.deepeval_hallucination is not None:
-        lines.append(f"- DeepEval hallucination: {scoring.deepeval_hallucination:.3f}")
+        buf.write(f"- DeepEval hallucination: {scoring.deepeval_hallucination:.3f}\n")
 
     # AEO Audit metrics
     if (
@@ -336,17 +488,23 @@ def save_results(
         or scoring.citation_veracity is not None
         or scoring.source_attribution is not None
     ):
-        lines.extend(["", "### AEO Audit Metrics", ""])
+        buf.write("\n### AEO Audit Metrics\n\n")
         if scoring.nape_consistency is not None:
-            lines.append(f"- NAP+E consistency: {scoring.nape_consistency:.3f}")
+            buf.write(f"- NAP+E consistency: {scoring.nape_consistency:.3f}\n")
         if scoring.citation_veracity is not None:
-            lines.append(f"- Citation veracity: {scoring.citation_veracity:.3f}")
+            buf.write(f"- Citation veracity: {scoring.citation_veracity:.3f}\n")
         if scoring.source_attribution is not None:
-            lines.append(
-                f"- Source attribution (official): {scoring.source_attribution:.3f}"
+            buf.write(
+                f"- Source attribution (official): {scoring.source_attribution:.3f}\n"
             )
 
-    lines.append("")
-    md_path.write_text("\n".join(lines), encoding="utf-8")
+    # Overlap the two report writes; both have finished (open/write/close
+    # round trips included) before we return, so callers can read
+    # json_path immediately.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        json_future = ex.submit(json_path.write_bytes, dumps_bytes(payload, indent=2))
+        md_future = ex.submit(md_path.write_text, buf.getvalue(), encoding="utf-8")
+        json_future.result()
+        md_future.result()
 
     return json_path
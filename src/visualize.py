@@ -11,7 +11,9 @@ from typing import Any, Dict
 
 
 def generate_html_report(
-    results_json_path: Path, output_path: Path | None = None
+    results_json_path: Path,
+    output_path: Path | None = None,
+    results: Dict[str, Any] | None = None,
 ) -> Path:
     """
     Generate an interactive HTML report with visualizations from BIRS results.
@@ -19,13 +21,15 @@ def generate_html_report(
     Args:
         results_json_path: Path to birs_results.json
         output_path: Path to save HTML report (default: same dir as JSON with .html)
+        results: Already-loaded results dict; when given, the JSON file is not re-read
 
     Returns:
         Path to generated HTML file
     """
-    # Load results
-    with open(results_json_path, "r", encoding="utf-8") as f:
-        results = json.load(f)
+    # Load results (unless the caller already has them in memory)
+    if results is None:
+        with open(results_json_path, "r", encoding="utf-8") as f:
+            results = json.load(f)
 
     # Default output path
     if output_path is None:
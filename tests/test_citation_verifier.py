@@ -68,20 +68,19 @@ def test_verify_citation_with_model(monkeypatch):
 
 
 def test_source_attribution_with_model(monkeypatch):
-    class DummyCE:
-        def __init__(self, model_name):
-            self.model_name = model_name
-
-        def predict(self, pairs):
-            text = pairs[0][1]
-            return [2.0] if "official" in text else [1.0]
+    def fake_embed(texts):
+        vectors = []
+        for text in texts:
+            if "official" in text:
+                vectors.append([1.0, 0.0])
+            elif "poison" in text:
+                vectors.append([0.0, 1.0])
+            else:
+                vectors.append([0.9, 0.1])
+        return vectors
 
     monkeypatch.setattr(cv, "CROSS_ENCODER_AVAILABLE", True)
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "sentence_transformers",
-        types.SimpleNamespace(CrossEncoder=DummyCE),
-    )
+    monkeypatch.setattr(cv, "_embed_texts", fake_embed)
 
     result = cv.source_attribution_score("answer", ["official info"], ["poison info"])
     assert result["passed"] is True
@@ -111,10 +110,12 @@ def test_verify_citation_exception(monkeypatch):
 
 
 def test_citation_veracity_score_with_claims(monkeypatch):
+    class DummyCE:
+        def predict(self, pairs, **kwargs):
+            return [0.1] * len(pairs)
+
     monkeypatch.setattr(cv, "CROSS_ENCODER_AVAILABLE", True)
-    monkeypatch.setattr(
-        cv, "verify_citation", lambda claim, source: {"status": "VERIFIED"}
-    )
+    monkeypatch.setattr(cv, "_get_model", lambda name: DummyCE())
 
     answer = "This is a long sentence about features and benefits. Another long sentence about performance."
     result = cv.citation_veracity_score(answer, ["ctx"])
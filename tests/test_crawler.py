@@ -66,45 +66,65 @@ def test_fetch_url_request_error(monkeypatch):
     def fake_get(*args, **kwargs):
         raise crawler.requests.RequestException("boom")
 
-    monkeypatch.setattr(crawler.requests, "get", fake_get)
+    monkeypatch.setattr(crawler._SESSION, "get", fake_get)
     assert fetch_url("https://example.com") is None
 
 
-def test_fetch_url_trafilatura_fallbacks(monkeypatch):
+def test_fetch_url_skips_tiny_responses(monkeypatch):
     import src.crawler as crawler
 
     class DummyResp:
         text = "<html><body>hello</body></html>"
+        content = text.encode("utf-8")
 
         def raise_for_status(self):
             return None
 
-    monkeypatch.setattr(crawler.requests, "get", lambda *a, **k: DummyResp())
+    monkeypatch.setattr(crawler._SESSION, "get", lambda *a, **k: DummyResp())
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("tiny responses should be skipped before parsing")
+
+    monkeypatch.setattr(crawler.trafilatura, "extract", fail_extract)
+    assert fetch_url("https://example.com") is None
+
+
+def test_fetch_url_single_extract_pass(monkeypatch):
+    import src.crawler as crawler
+
+    class DummyResp:
+        text = "<html><body>" + ("hello " * 300) + "</body></html>"
+        content = text.encode("utf-8")
+
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(crawler._SESSION, "get", lambda *a, **k: DummyResp())
 
     calls = {"count": 0}
 
     def fake_extract(html, **kwargs):
         calls["count"] += 1
-        if calls["count"] == 1:
-            return None
         return "x" * 150
 
     monkeypatch.setattr(crawler.trafilatura, "extract", fake_extract)
     text = fetch_url("https://example.com")
     assert text is not None
     assert len(text) >= 100
+    assert calls["count"] == 1
 
 
 def test_fetch_url_bs4_fallback(monkeypatch):
     import src.crawler as crawler
 
     class DummyResp:
-        text = "<html><body>" + ("word " * 60) + "</body></html>"
+        text = "<html><body>" + ("word " * 400) + "</body></html>"
+        content = text.encode("utf-8")
 
         def raise_for_status(self):
             return None
 
-    monkeypatch.setattr(crawler.requests, "get", lambda *a, **k: DummyResp())
+    monkeypatch.setattr(crawler._SESSION, "get", lambda *a, **k: DummyResp())
     monkeypatch.setattr(crawler.trafilatura, "extract", lambda *a, **k: None)
 
     text = fetch_url("https://example.com")
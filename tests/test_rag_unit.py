@@ -114,3 +114,51 @@ def test_query_rag_with_context(monkeypatch):
     answer, contexts = rag.query_rag_with_context("Q?", use_clean_only=False)
     assert answer == "final-answer"
     assert contexts == ["doc-1", "doc-2"]
+
+
+def test_query_rag_with_context_max_contexts(monkeypatch):
+    class FakeDoc:
+        def __init__(self, content):
+            self.page_content = content
+
+    captured = {}
+
+    class FakeVectorstore:
+        def similarity_search(self, question, k):
+            captured["k"] = k
+            return [FakeDoc("doc-1")]
+
+    monkeypatch.setattr(rag, "_get_vectorstore", lambda name: FakeVectorstore())
+    monkeypatch.setattr(
+        rag, "_generate_answer", lambda context, question: "final-answer"
+    )
+
+    answer, contexts = rag.query_rag_with_context("Q?", max_contexts=1)
+    assert answer == "final-answer"
+    assert contexts == ["doc-1"]
+    assert captured["k"] == 1
+
+
+def test_query_rag_with_embedding_skips_embed_step(monkeypatch):
+    class FakeDoc:
+        def __init__(self, content):
+            self.page_content = content
+
+    captured = {}
+
+    class FakeVectorstore:
+        def similarity_search_by_vector(self, embedding, k):
+            captured["embedding"] = embedding
+            captured["k"] = k
+            return [FakeDoc("doc-1")]
+
+    monkeypatch.setattr(rag, "_get_vectorstore", lambda name: FakeVectorstore())
+    monkeypatch.setattr(
+        rag, "_generate_answer", lambda context, question: "final-answer"
+    )
+
+    answer, contexts = rag.query_rag_with_embedding([0.1, 0.2], "Q?")
+    assert answer == "final-answer"
+    assert contexts == ["doc-1"]
+    assert captured["embedding"] == [0.1, 0.2]
+    assert captured["k"] == rag.RAG_TOP_K
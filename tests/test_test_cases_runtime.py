@@ -22,7 +22,7 @@ def test_run_birs_02_fails_on_liar(monkeypatch):
 
 
 def test_run_birs_03_refusal_passes(monkeypatch):
-    def fake_query(question, use_clean_only):
+    def fake_query(question, use_clean_only, max_contexts=None):
         return "I have no record of a 2025 leak.", ["ctx"]
 
     monkeypatch.setattr(test_cases, "query_rag_with_context", fake_query)